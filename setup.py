@@ -0,0 +1,13 @@
+# Optional build of the Cython-compiled SQL parsing helpers:
+#   python setup.py build_ext --inplace
+# Without it, the pure-Python pg_typed_py/_parse.py is used.
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=cythonize(
+        [Extension("pg_typed_py._parse", ["src/pg_typed_py/_parse.py"])],
+        compiler_directives={"language_level": "3"},
+    ),
+    package_dir={"": "src"},
+)
@@ -0,0 +1,10 @@
+# Static types for compiling _parse.py with Cython: python setup.py build_ext --inplace
+cimport cython
+
+cpdef list extract_params(str sql)
+
+@cython.locals(queries=list, matches=list, i=Py_ssize_t, end=Py_ssize_t, sql=str)
+cpdef list parse_multi_query_file(str content)
+
+@cython.locals(comparisons=dict, column=str, op=str, params=list, param=str)
+cpdef dict param_comparisons(str sql)
@@ -0,0 +1,91 @@
+"""
+SQL parsing helpers, kept free of database access so they can be compiled
+with Cython (see _parse.pxd). This module is used as is when no compiled
+extension is built.
+"""
+
+import re
+from typing import List, Dict, Tuple
+
+# Precompiled patterns used by the parsing helpers
+_PARAM_RE = re.compile(r":(\w+)")
+# A comment block with name= and, anywhere in the same block, query_type=
+_NAME_BLOCK_RE = re.compile(
+    r"/\*"
+    r"(?=(?:(?!\*/).)*?(?i:query_type)\s*=\s*(?P<qtype>(?i:single|multi)))?"
+    r".*?name\s*=\s*(?P<name>[\w_]+).*?\*/",
+    re.DOTALL,
+)
+# Column comparisons with parameters: "column op :param", "column IN (:a, :b)"
+# and the reversed ":param op column". Only flat lists of parameters count as
+# IN lists, so comparisons inside an IN (SELECT ...) subquery are still found
+_COMPARISON_RE = re.compile(
+    r"(?P<col>\w+)\s*(?P<op>[=<>!]+|\bI?LIKE\b|\bIN\b)\s*"
+    r"(?P<rhs>\(\s*:\w+(?:\s*,\s*:\w+)*\s*\)|:\w+)"
+    r"|:(?P<rev_param>\w+)\s*(?P<rev_op>[=<>!]+)\s*(?P<rev_col>\w+)",
+    re.IGNORECASE,
+)
+
+
+def extract_params(sql: str) -> List[str]:
+    """Find :param parameters in SQL."""
+    return sorted(set(_PARAM_RE.findall(sql)))
+
+
+def parse_multi_query_file(content: str) -> List[Dict]:
+    """
+    Parse a SQL file that may contain multiple queries with name= comments.
+    Returns list of dicts with 'name', 'sql', and 'query_type' keys.
+    """
+    queries = []
+
+    # Each comment block with name= starts a query whose SQL runs up to the
+    # next such block (or the end of the file)
+    matches = list(_NAME_BLOCK_RE.finditer(content))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        # Clean up the SQL (remove trailing semicolons)
+        sql = content[match.end() : end].strip().rstrip(";")
+        if sql:
+            query_type = match.group("qtype")
+            queries.append(
+                {
+                    "name": match.group("name"),
+                    "sql": sql,
+                    "query_type": query_type.lower() if query_type else "multi",
+                }
+            )
+
+    # If no named queries found, treat the entire content as a single query
+    # and derive name from filename (handled in main function)
+    if not queries:
+        sql = content.strip().rstrip(";")
+        if sql:
+            queries.append(
+                {
+                    "name": None,  # Will be set by main function
+                    "sql": sql,
+                    "query_type": "multi",  # default
+                }
+            )
+
+    return queries
+
+
+def param_comparisons(sql: str) -> Dict[str, List[Tuple[str, str, bool]]]:
+    """
+    Map each :param to the (column, operator, reversed) comparisons it is
+    used in, in a single pass over the SQL. reversed is True for the
+    ":param op column" form.
+    """
+    comparisons = {}
+    for match in _COMPARISON_RE.finditer(sql):
+        if match.group("rev_col"):
+            column, op, reverse = match.group("rev_col"), match.group("rev_op"), True
+            params = [match.group("rev_param")]
+        else:
+            column, op, reverse = match.group("col"), match.group("op").upper(), False
+            params = _PARAM_RE.findall(match.group("rhs"))
+        for param in params:
+            comparisons.setdefault(param, []).append((column, op, reverse))
+    return comparisons
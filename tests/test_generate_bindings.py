@@ -0,0 +1,190 @@
+import contextlib
+import uuid
+
+import pytest
+
+from pg_typed_py import generate_bindings
+
+OID_TO_PY = {2950: "uuid.UUID", 25: "str", 1184: "datetime.datetime"}
+
+
+class StubEngine:
+    def connect(self):
+        return contextlib.nullcontext()
+
+
+class StubResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size):
+        chunk, self._rows = self._rows[:size], self._rows[size:]
+        return chunk
+
+    def all(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def __iter__(self):
+        return iter(self.all())
+
+
+class StubSession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, statement, params, **kwargs):
+        return StubResult(self.rows)
+
+
+@pytest.fixture
+def generate(tmp_path, monkeypatch):
+    """
+    Generate bindings for SQL with stubbed introspection, where every query
+    returns the given columns, and load the generated module.
+    """
+
+    def generate(sql, columns, uuid_native=True, **options):
+        monkeypatch.setattr(generate_bindings, "ruff_api", None)
+        monkeypatch.setattr(
+            generate_bindings, "get_oid_to_py", lambda connection, *args: OID_TO_PY
+        )
+        monkeypatch.setattr(
+            generate_bindings, "returns_native_uuid", lambda connection: uuid_native
+        )
+        monkeypatch.setattr(
+            generate_bindings,
+            "savepoint",
+            lambda connection, name: contextlib.nullcontext(),
+        )
+        monkeypatch.setattr(
+            generate_bindings,
+            "describe_queries",
+            lambda connection, statements, oid_to_py: [
+                (columns, {p: "str" for p in param_names})
+                for _, param_names in statements
+            ],
+        )
+        sql_file = tmp_path / "queries.sql"
+        sql_file.write_text(sql)
+        output_file = generate_bindings.generate_bindings_file(
+            str(sql_file), StubEngine(), **options
+        )
+        with open(output_file) as f:
+            source = f.read()
+        namespace = {}
+        exec(compile(source, output_file, "exec"), namespace)
+        return namespace
+
+    return generate
+
+
+def test_duplicate_column_names(generate):
+    bindings = generate(
+        "/* name=get_orders */ SELECT u.id, o.id FROM users u JOIN orders o USING (id)",
+        [("id", 2950), ("id", 2950)],
+    )
+    user_id, order_id = uuid.uuid4(), uuid.uuid4()
+    rows = bindings["get_orders"](StubSession([(user_id, order_id)]))
+    assert rows == [bindings["GetOrdersRow"](id=user_id, id_1=order_id)]
+
+
+@pytest.mark.parametrize("uuid_native", [True, False])
+def test_same_shape_reuses_class_under_both_names(generate, uuid_native):
+    bindings = generate(
+        "/* name=get_all_users */ SELECT id, email FROM users;"
+        "/* name=get_user_by_email */ SELECT id, email FROM users WHERE email = :email",
+        [("id", 2950), ("email", 25)],
+        uuid_native=uuid_native,
+    )
+    assert bindings["GetUserByEmailRow"] is bindings["GetAllUsersRow"]
+    # The driver hands back strings unless it returns native UUIDs
+    user_id = uuid.uuid4()
+    row = (user_id if uuid_native else str(user_id), "a@example.com")
+    rows = bindings["get_user_by_email"](StubSession([row]), email="a@example.com")
+    assert rows == [bindings["GetUserByEmailRow"](user_id, "a@example.com")]
+
+
+def test_source_hash_covers_generator(monkeypatch):
+    content_hash = generate_bindings.source_hash("SELECT 1", "dataclass")
+    monkeypatch.setattr(generate_bindings, "generator_hash", lambda: "upgraded")
+    assert generate_bindings.source_hash("SELECT 1", "dataclass") != content_hash
+
+
+class StubTypeConnection:
+    """Connection whose pg_type lookups return the given rows."""
+
+    def __init__(self, pg_types):
+        self.connection = self
+        self.pg_types = pg_types
+        self.queries = 0
+
+    def get_backend_pid(self):
+        return 1234
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql):
+        self.queries += 1
+
+    def fetchall(self):
+        return list(self.pg_types.items())
+
+
+def test_oid_maps_are_cached_per_run_only():
+    connection = StubTypeConnection({2950: "uuid"})
+    type_cache = {}
+    assert generate_bindings.get_oid_to_py(connection, type_cache) == {
+        2950: "uuid.UUID"
+    }
+    generate_bindings.get_oid_to_py(connection, type_cache)
+    assert connection.queries == 1
+
+    # Another run against a database on a backend with the same PID
+    other = StubTypeConnection({2950: "text"})
+    assert generate_bindings.get_oid_to_py(other, {}) == {2950: "str"}
+
+
+USERS_SQL = """
+/* name=get_users */
+SELECT id, email FROM users;
+
+/* name=get_user query_type=single */
+SELECT id, email FROM users WHERE email = :email;
+"""
+
+
+@pytest.mark.parametrize("row_type", generate_bindings.ROW_TYPES)
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("uuid_native", [True, False])
+def test_generated_rows(generate, row_type, stream, uuid_native):
+    bindings = generate(
+        USERS_SQL,
+        [("id", 2950), ("email", 25)],
+        uuid_native=uuid_native,
+        row_type=row_type,
+        stream=stream,
+    )
+    row_class = bindings["GetUsersRow"]
+    assert issubclass(row_class, tuple) == (row_type == "namedtuple")
+
+    # More rows than one streamed chunk
+    user_ids = [uuid.uuid4() for _ in range(generate_bindings.STREAM_CHUNK_SIZE + 1)]
+    rows = [
+        (user_id if uuid_native else str(user_id), f"{i}@example.com")
+        for i, user_id in enumerate(user_ids)
+    ]
+    expected = [
+        row_class(user_id, f"{i}@example.com") for i, user_id in enumerate(user_ids)
+    ]
+
+    result = bindings["get_users"](StubSession(rows))
+    assert isinstance(result, list) != stream
+    assert list(result) == expected
+
+    user = bindings["get_user"](StubSession(rows[:1]), email="0@example.com")
+    assert user == expected[0]
@@ -0,0 +1,69 @@
+import pytest
+
+from pg_typed_py._parse import param_comparisons
+from pg_typed_py.generate_bindings import infer_param_types_from_context
+
+
+class StubCursor:
+    """Cursor whose information_schema lookups find no column."""
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchone(self):
+        return None
+
+
+class StubConnection:
+    def __init__(self):
+        self.connection = self
+
+    def cursor(self):
+        return StubCursor()
+
+
+def test_param_comparisons():
+    sql = (
+        "SELECT * FROM users u WHERE u.id = :id AND created_at >= :since"
+        " AND :max > score AND status IN (:a, :b) AND name ILIKE :pattern"
+    )
+    assert param_comparisons(sql) == {
+        "id": [("id", "=", False)],
+        "since": [("created_at", ">=", False)],
+        "max": [("score", ">", True)],
+        "a": [("status", "IN", False)],
+        "b": [("status", "IN", False)],
+        "pattern": [("name", "ILIKE", False)],
+    }
+
+
+@pytest.mark.parametrize(
+    ("sql", "param", "expected"),
+    [
+        # Parameters named after their column
+        ("WHERE id = :id", "id", "uuid.UUID"),
+        ("WHERE email = :email", "email", "str"),
+        ("WHERE created_at > :created_at", "created_at", "datetime.datetime"),
+        # Column names matched by suffix
+        ("WHERE last_updated_at > :p", "p", "datetime.datetime"),
+        ("WHERE due_date < :p", "p", "datetime.datetime"),
+        ("WHERE userid = :p", "p", "uuid.UUID"),
+        ("WHERE user_email = :p", "p", "str"),
+        # id and email hints only apply to "column = :param"
+        ("WHERE id != :p", "p", "Any"),
+        ("WHERE id IN (:p, :q)", "p", "Any"),
+        ("WHERE :p = id", "p", "Any"),
+        ("WHERE name LIKE :p", "p", "str"),
+        ("WHERE score > :p", "p", "Any"),
+        # Comparisons inside IN subqueries
+        (
+            "WHERE user_id IN (SELECT user_id FROM orders WHERE created_at > :p)",
+            "p",
+            "datetime.datetime",
+        ),
+        ("WHERE id IN (SELECT user_id FROM orders WHERE email = :p)", "p", "str"),
+    ],
+)
+def test_infer_param_types_from_context(sql, param, expected):
+    param_types = infer_param_types_from_context(StubConnection(), sql, [param])
+    assert param_types[param] == expected
@@ -0,0 +1,53 @@
+import pytest
+
+from pg_typed_py._parse import extract_params, parse_multi_query_file
+
+
+def query(name, sql, query_type="multi"):
+    return {"name": name, "sql": sql, "query_type": query_type}
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (
+            "/*\nname=get_users\nquery_type=single\n*/\nSELECT 1;\n",
+            [query("get_users", "SELECT 1", "single")],
+        ),
+        # query_type may come before name=
+        (
+            "/* query_type=single name=get_count */ SELECT count(*) FROM users;",
+            [query("get_count", "SELECT count(*) FROM users", "single")],
+        ),
+        # query_type is case-insensitive
+        (
+            "/* Query_Type = SINGLE\n   name=get_one */ SELECT 1",
+            [query("get_one", "SELECT 1", "single")],
+        ),
+        # query_type only applies to the block it is in
+        (
+            "/* name=a */ SELECT 1; /* query_type=single name=b */ SELECT 2;",
+            [query("a", "SELECT 1"), query("b", "SELECT 2", "single")],
+        ),
+        (
+            "/* name=a */ SELECT 1 /* note: query_type=single */",
+            [query("a", "SELECT 1 /* note: query_type=single */")],
+        ),
+        # Named blocks without SQL are skipped
+        (
+            "/* name=empty */\n\n/* name=b */ SELECT 2",
+            [query("b", "SELECT 2")],
+        ),
+        # Without named blocks the whole file is one unnamed query
+        ("SELECT * FROM users;\n", [query(None, "SELECT * FROM users")]),
+        ("", []),
+        ("  \n", []),
+    ],
+)
+def test_parse_multi_query_file(content, expected):
+    assert parse_multi_query_file(content) == expected
+
+
+def test_extract_params():
+    sql = "SELECT * FROM users WHERE email = :email OR id = :id OR email = :email"
+    assert extract_params(sql) == ["email", "id"]